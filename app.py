@@ -1,14 +1,37 @@
 import os
-import io
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, Optional, Tuple
 
 import numpy as np
 import pydicom
 import PySimpleGUI as sg
-from PIL import Image, ImageDraw
+from PIL import Image, ImageDraw, ImageTk
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; fall back to the numpy path
+    njit = None
+
+try:
+    import cv2
+except ImportError:  # opencv is optional; Pillow does the resizing without it
+    cv2 = None
+
+try:
+    import cupy as cp
+except ImportError:  # cupy is optional; windowing stays on the CPU without it
+    cp = None
 
 IMG_DIR = os.path.join(os.path.dirname(__file__), 'img')
 PLANE_OPTIONS = ('Sagittal', 'Coronal')
+SLIDER_EVENTS = ('-AXIAL_SLICE-', '-REFORM_SLICE-', '-WW-', '-WL-')
+RENDER_INTERVAL_MS = 16  # coalesce slider events into at most one render per frame (~60 Hz)
+SETTLE_DELAY_MS = 150  # idle time after a slider drag before re-rendering with bilinear filtering
+PRESET_CACHE_SIZE = 2  # presets whose windowed uint8 plane stacks are kept (each up to 3 volumes)
+LOAD_WORKERS = min(8, os.cpu_count() or 1)  # threads for DICOM reading/decoding (I/O and codecs release the GIL)
 
 TITLE_FONT = ('Arial', 16, 'bold')
 SUBTITLE_FONT = ('Arial', 12)
@@ -23,97 +46,265 @@ def load_dicom_series(folder: str) -> Tuple[np.ndarray, list]:
     if not files:
         raise FileNotFoundError(f'No DICOM files found in {folder}')
 
-    datasets = []
-    for file_path in files:
+    def read_file(file_path):
         try:
             ds = pydicom.dcmread(file_path)
-            datasets.append(ds)
+            pixels = ds.pixel_array
         except Exception as exc:  # skip unreadable files but keep going
             print('Failed to read', file_path, exc)
+            return None
+        # Keep only the header on the dataset so each slice is not held twice next to the volume.
+        del ds.PixelData
+        ds._pixel_array = None
+        return ds, pixels
 
-    if not datasets:
+    # Each file is parsed and decoded once; I/O and pixel codecs release the GIL.
+    with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as pool:
+        entries = [entry for entry in pool.map(read_file, files) if entry is not None]
+
+    if not entries:
         raise RuntimeError('No readable DICOM files were found.')
 
-    def sort_key(ds):
+    def sort_key(entry):
+        ds = entry[0]
         if 'InstanceNumber' in ds:
             return int(ds.InstanceNumber)
         if 'ImagePositionPatient' in ds:
             return float(ds.ImagePositionPatient[2])
         return 0
 
-    datasets.sort(key=sort_key)
-
-    first = datasets[0]
-    rows = int(first.Rows)
-    cols = int(first.Columns)
-    volume = np.zeros((len(datasets), rows, cols), dtype=np.float32)
-
+    entries.sort(key=sort_key)
+    datasets = [ds for ds, _ in entries]
+    raw = np.stack([pixels for _, pixels in entries])
+    del entries
+    slopes = np.ones(len(datasets), dtype=np.float32)
+    intercepts = np.zeros(len(datasets), dtype=np.float32)
     for idx, ds in enumerate(datasets):
-        pixel_array = ds.pixel_array.astype(np.float32)
         if 'RescaleIntercept' in ds and 'RescaleSlope' in ds:
-            pixel_array = pixel_array * float(ds.RescaleSlope) + float(ds.RescaleIntercept)
-        volume[idx] = pixel_array
-
+            slopes[idx] = float(ds.RescaleSlope)
+            intercepts[idx] = float(ds.RescaleIntercept)
+
+    # CT series almost always store HU as raw + integer intercept with slope 1, which
+    # can be applied directly in int16; only fractional rescales go through float32.
+    hu_low = float(raw.min()) + float(intercepts.min())
+    hu_high = float(raw.max()) + float(intercepts.max())
+    if (np.all(slopes == 1) and np.all(intercepts == np.rint(intercepts))
+            and np.abs(intercepts).max() <= 32767 and -32768 <= hu_low and hu_high <= 32767):
+        volume = raw.astype(np.int16, copy=False)  # wraps for large uint16, undone by the add
+        np.add(volume, intercepts.astype(np.int16)[:, None, None], out=volume)
+        return volume, datasets
+
+    # Rescale the whole stack in one vectorized pass instead of per slice.
+    volume = raw.astype(np.float32)
+    del raw
+    if np.all(slopes == slopes[0]) and np.all(intercepts == intercepts[0]):
+        np.multiply(volume, slopes[0], out=volume)
+        np.add(volume, intercepts[0], out=volume)
+    else:
+        np.multiply(volume, slopes[:, None, None], out=volume)
+        np.add(volume, intercepts[:, None, None], out=volume)
+
+    # Only quantize when it is lossless; otherwise keep float32 so the displayed values
+    # match the stored ones (fractional rescales, or values outside the int16 range).
+    if volume.min() >= -32768 and volume.max() <= 32767 and np.array_equal(np.rint(volume), volume):
+        return volume.astype(np.int16), datasets
     return volume, datasets
 
 
-def window_level_image(img: np.ndarray, ww: float, wl: float) -> np.ndarray:
-    """Apply window/level to a 2D image and return an 8-bit array."""
+def window_bounds(ww: float, wl: float) -> Tuple[float, float]:
+    """Return the (low, high) intensity range covered by a window width/level."""
     ww = max(float(ww), 1.0)
-    low = wl - (ww / 2.0)
-    high = wl + (ww / 2.0)
+    return wl - (ww / 2.0), wl + (ww / 2.0)
+
+
+# Every int16 value as float32, in uint16 bit-pattern order (the LUT index order).
+_LUT_DOMAIN = np.arange(65536, dtype=np.uint16).view(np.int16).astype(np.float32)
+
+
+def _window_float(img: np.ndarray, low: float, high: float) -> np.ndarray:
+    """Clip and scale *img* to uint8 using a single float scratch array.
+
+    Each call allocates one scratch array (instead of a temporary per step) and
+    updates it in place in the original clip/subtract/divide/multiply order, so
+    results are bit-identical to the plain expression.
+    """
+    scratch = np.empty(img.shape, dtype=np.result_type(img.dtype, 1.0))
+    np.clip(img, low, high, out=scratch)
+    np.subtract(scratch, low, out=scratch)
+    np.divide(scratch, high - low, out=scratch)
+    np.multiply(scratch, 255.0, out=scratch)
+    return scratch.astype(np.uint8)
+
+
+@lru_cache(maxsize=64)
+def window_lut(ww: float, wl: float) -> np.ndarray:
+    """Return a 65536-entry uint8 table mapping every int16 value through window/level.
+
+    The table is ordered by the uint16 bit pattern so an int16 image can index it
+    directly via ``img.view(np.uint16)`` without any offset or clipping.
+    """
+    low, high = window_bounds(ww, wl)
     if high == low:
-        return np.zeros_like(img, dtype=np.uint8)
-    clipped = np.clip(img, low, high)
-    norm = ((clipped - low) / (high - low) * 255.0).astype(np.uint8)
-    return norm
+        lut = np.zeros(65536, dtype=np.uint8)
+    else:
+        lut = _window_float(_LUT_DOMAIN, low, high)
+    lut.setflags(write=False)
+    return lut
 
 
-def to_pil(img2d: np.ndarray, size: Optional[Tuple[int, int]] = None, overlay_line=None) -> bytes:
-    """Convert 2D uint8 array into PNG bytes for PySimpleGUI."""
-    im = Image.fromarray(img2d.astype(np.uint8), mode='L')
+def window_level_image(img: np.ndarray, ww: float, wl: float) -> np.ndarray:
+    """Apply window/level to a 2D image and return an 8-bit array.
+
+    int16 images go through the cached LUT; other dtypes use the float arithmetic directly.
+    """
+    if img.dtype == np.int16:
+        return window_lut(ww, wl)[img.view(np.uint16)]
+    low, high = window_bounds(ww, wl)
+    return _window_float(img, low, high)
+
+
+def to_pil(img2d: np.ndarray, size: Optional[Tuple[int, int]] = None, overlay_line=None, fast: bool = False) -> Image.Image:
+    """Convert 2D uint8 array into a display-sized PIL image.
+
+    With *fast* the resize uses nearest-neighbour sampling for live slider drags.
+    """
+    img2d = img2d.astype(np.uint8)
+    # cv2's INTER_LINEAR does not antialias when shrinking, so it is only used to enlarge;
+    # downscales (e.g. thin-slice reformats) keep Pillow's filtered bilinear resize.
+    enlarging = size and size[0] >= img2d.shape[1] and size[1] >= img2d.shape[0]
+    if cv2 is not None and size and (fast or enlarging):
+        img2d = cv2.resize(img2d, size, interpolation=cv2.INTER_NEAREST if fast else cv2.INTER_LINEAR)
+        size = None
+    im = Image.fromarray(img2d, mode='L')
     if size:
-        im = im.resize(size, Image.BILINEAR)
+        im = im.resize(size, Image.NEAREST if fast else Image.BILINEAR)
     if overlay_line is not None:
         draw = ImageDraw.Draw(im)
         x1, y1, x2, y2, color = overlay_line
         draw.line((x1, y1, x2, y2), fill=color, width=2)
-    bio = io.BytesIO()
-    im.save(bio, format='PNG')
-    return bio.getvalue()
+    return im
 
 
 def clamp(value: int, minimum: int, maximum: int) -> int:
     return max(min(int(value), maximum), minimum)
 
 
+def histogram_percentiles(volume: np.ndarray, percentiles: Tuple[float, ...]) -> Tuple[float, ...]:
+    """Return ``np.percentile`` results for an int16 volume from a single histogram pass."""
+    if njit is None or volume.dtype != np.int16:
+        return tuple(float(v) for v in np.percentile(volume, percentiles))
+    counts = np.zeros(65536, dtype=np.int64)
+    _int16_histogram(volume.ravel(), counts)
+    # Reorder from uint16 bit order to ascending int16 values (-32768 .. 32767).
+    cum = np.cumsum(np.concatenate((counts[32768:], counts[:32768])))
+
+    def value_at(rank: int) -> int:
+        return int(np.searchsorted(cum, rank, side='right')) - 32768
+
+    results = []
+    for q in percentiles:
+        pos = (volume.size - 1) * (q / 100.0)
+        below = int(np.floor(pos))
+        lower = value_at(below)
+        upper = value_at(min(below + 1, volume.size - 1))
+        results.append(float(lower + (upper - lower) * (pos - below)))
+    return tuple(results)
+
+
 def compute_default_window(volume: np.ndarray) -> Tuple[float, float]:
-    low = float(np.percentile(volume, 5))
-    high = float(np.percentile(volume, 95))
+    low, high = histogram_percentiles(volume, (5, 95))
     ww = max(high - low, 1.0)
     wl = (high + low) / 2.0
     return ww, wl
 
 
 def extract_plane(volume: np.ndarray, plane: str, index: int) -> np.ndarray:
-    """Return a 2D slice for the requested plane."""
+    """Return a 2D slice for the requested plane.
+
+    Reformatted planes are displayed rotated 90 degrees and flipped vertically,
+    which is exactly a transpose, so every plane is returned as a zero-copy view.
+    """
     z_dim, y_dim, x_dim = volume.shape  # y == rows, x == cols
     if plane == 'Axial':
         index = clamp(index, 0, z_dim - 1)
         return volume[index]
     if plane == 'Sagittal':
         index = clamp(index, 0, x_dim - 1)
-        plane_img = volume[:, :, index]
-        plane_img = np.rot90(plane_img, k=1)
-        return np.flipud(plane_img)
+        return volume[:, :, index].T
     if plane == 'Coronal':
         index = clamp(index, 0, y_dim - 1)
-        plane_img = volume[:, index, :]
-        plane_img = np.rot90(plane_img, k=1)
-        return np.flipud(plane_img)
+        return volume[:, index, :].T
     raise ValueError(f'Unknown plane: {plane}')
 
 
+def build_plane_volumes(volume: np.ndarray) -> Dict[str, np.ndarray]:
+    """Return contiguous per-plane stacks so that ``stack[i] == extract_plane(volume, plane, i)``.
+
+    Each stack is the volume with its axes reordered and copied once, making every
+    slice a row-major read.
+    """
+    return {
+        'Axial': volume,
+        'Sagittal': np.ascontiguousarray(volume.transpose(2, 1, 0)),
+        'Coronal': np.ascontiguousarray(volume.transpose(1, 2, 0)),
+    }
+
+
+def upload_plane_volumes(plane_volumes: Dict[str, np.ndarray]) -> Optional[Dict[str, np.ndarray]]:
+    """Copy the plane stacks to the GPU for whole-stack windowing, or return None.
+
+    Single slices stay on the CPU, where a numba/LUT pass is cheaper than the
+    host round trip. A trial window of one slice checks that CuPy can compile and
+    run its kernels (NVRTC), not just copy memory, before the GPU is used.
+    """
+    if cp is None or plane_volumes['Axial'].dtype != np.int16:  # the device path is LUT-only
+        return None
+    try:
+        device_volumes = {plane: cp.asarray(stack) for plane, stack in plane_volumes.items()}
+        window_level_array(device_volumes['Axial'][:1], 1, 0)
+        return device_volumes
+    except Exception as exc:  # no usable device, memory or CUDA toolkit; stay on the CPU
+        print('GPU windowing disabled:', exc)
+        return None
+
+
+@lru_cache(maxsize=64)
+def _device_window_lut(ww: float, wl: float):
+    return cp.asarray(window_lut(ww, wl))
+
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _window_kernel(src, low, high, scale, out):
+        # Branchless float32 clip + scale with the same op order as window_lut, so the
+        # output is bit-identical; LLVM vectorizes this loop, unlike a LUT gather.
+        for i in prange(src.size):
+            value = min(max(np.float32(src[i]), low), high)
+            out[i] = np.uint8((value - low) / scale * np.float32(255.0))
+
+    @njit(cache=True)
+    def _int16_histogram(flat, counts):
+        for i in range(flat.size):
+            counts[flat[i] & 0xFFFF] += 1
+
+
+def window_level_array(src: np.ndarray, ww: float, wl: float) -> np.ndarray:
+    """Window an int16/float32 slice or stack of any shape into uint8 on the fastest available backend."""
+    if cp is not None and isinstance(src, cp.ndarray):
+        return cp.asnumpy(_device_window_lut(ww, wl)[src.view(cp.uint16)])
+    if njit is None or src.dtype not in (np.int16, np.float32):
+        return window_level_image(src, ww, wl)
+    low, high = window_bounds(ww, wl)
+    out = np.empty(src.shape, dtype=np.uint8)
+    _window_kernel(src.ravel(), np.float32(low), np.float32(high), np.float32(high - low), out.reshape(-1))
+    return out
+
+
+def render_plane(plane_volume: np.ndarray, index: int, ww: float, wl: float) -> np.ndarray:
+    """Window slice *index* of a stack from ``build_plane_volumes`` into a uint8 image."""
+    return window_level_array(plane_volume[clamp(index, 0, plane_volume.shape[0] - 1)], ww, wl)
+
+
 def plane_limit(volume: np.ndarray, plane: str) -> int:
     _, y_dim, x_dim = volume.shape
     return (x_dim - 1) if plane == 'Sagittal' else (y_dim - 1)
@@ -158,6 +349,11 @@ def main():
         return
 
     z_dim, y_dim, x_dim = volume.shape
+    # Fixed for the lifetime of the window, so look them up instead of recomputing per event.
+    plane_limits = {plane: plane_limit(volume, plane) for plane in PLANE_OPTIONS}
+    plane_labels = {plane: plane_label(plane) for plane in PLANE_OPTIONS}
+    plane_volumes = build_plane_volumes(volume)
+    device_volumes = upload_plane_volumes(plane_volumes)
     default_ww, default_wl = compute_default_window(volume)
     ww_slider_max = max(int(default_ww * 5), 2000)
     wl_min = int(min(np.floor(np.min(volume)), -1200))
@@ -174,7 +370,7 @@ def main():
 
     image_size = (520, 520)
     default_plane = PLANE_OPTIONS[0]
-    reformat_default = plane_limit(volume, default_plane) // 2
+    reformat_default = plane_limits[default_plane] // 2
 
     viewer_left = sg.Column([
         [sg.Text('Axial (元画像)', font=SECTION_FONT)],
@@ -197,7 +393,7 @@ def main():
         [sg.Slider(range=(0, z_dim - 1), key='-AXIAL_SLICE-', orientation='h', enable_events=True, default_value=z_dim // 2, resolution=1, expand_x=True)],
         [sg.Text('', key='-AXIAL_INFO-', size=(24, 1), font=CAPTION_FONT)],
         [sg.Text('再構成位置', font=LABEL_FONT)],
-        [sg.Slider(range=(0, plane_limit(volume, default_plane)), key='-REFORM_SLICE-', orientation='h', enable_events=True, default_value=reformat_default, resolution=1, expand_x=True)],
+        [sg.Slider(range=(0, plane_limits[default_plane]), key='-REFORM_SLICE-', orientation='h', enable_events=True, default_value=reformat_default, resolution=1, expand_x=True)],
         [sg.Text('', key='-REFORM_INFO-', size=(24, 1), font=CAPTION_FONT)],
     ], expand_x=True)
 
@@ -251,7 +447,7 @@ def main():
     def parse_values(val_dict: Dict) -> Tuple[str, int, int, int, int, int]:
         plane = val_dict.get('-PLANE-', default_plane)
         axial_idx = clamp(round(val_dict.get('-AXIAL_SLICE-', 0)), 0, z_dim - 1)
-        reform_limit = plane_limit(volume, plane)
+        reform_limit = plane_limits[plane]
         reform_idx = clamp(round(val_dict.get('-REFORM_SLICE-', reformat_default)), 0, reform_limit)
         ww = clamp(round(val_dict.get('-WW-', default_ww)), 1, ww_slider_max)
         wl = clamp(round(val_dict.get('-WL-', default_wl)), wl_min, wl_max)
@@ -273,11 +469,11 @@ def main():
         return 0, y, width - 1, y, 255
 
     def update_reformat_slider(plane: str, current_idx: int) -> int:
-        limit = plane_limit(volume, plane)
+        limit = plane_limits[plane]
         adjusted_idx = clamp(current_idx, 0, limit)
         window['-REFORM_SLICE-'].update(range=(0, limit), value=adjusted_idx)
-        window['-PLANE_DESC-'].update(plane_label(plane))
-        window['-REFORM_TITLE-'].update(f'再構成断面 - {plane_label(plane)}')
+        window['-PLANE_DESC-'].update(plane_labels[plane])
+        window['-REFORM_TITLE-'].update(f'再構成断面 - {plane_labels[plane]}')
         return adjusted_idx
 
     def update_readouts(plane: str, axial_idx: int, reform_idx: int, reform_limit: int, ww: int, wl: int, *, update_status: bool = True) -> None:
@@ -287,29 +483,85 @@ def main():
         window['-WL_INFO-'].update(str(wl))
         if update_status:
             window['-STATUS-'].update(
-                f'平面: {plane_label(plane)} | Axial {axial_idx + 1}/{z_dim} | 再構成 {reform_idx + 1}/{reform_limit + 1} | WW {ww} | WL {wl}'
+                f'平面: {plane_labels[plane]} | Axial {axial_idx + 1}/{z_dim} | 再構成 {reform_idx + 1}/{reform_limit + 1} | WW {ww} | WL {wl}'
             )
 
-    def refresh_images(val_dict: Dict, *, update_status: bool = True) -> None:
+    photos: Dict[str, ImageTk.PhotoImage] = {}
+
+    def show_image(key: str, im: Image.Image) -> None:
+        # Paste pixels into one persistent Tk photo per pane instead of encoding
+        # an image file for sg.Image.update and having Tk decode it again.
+        photo = photos.get(key)
+        if photo is None or (photo.width(), photo.height()) != im.size:
+            photo = ImageTk.PhotoImage(im, master=window[key].Widget)
+            window[key].Widget.configure(image=photo)
+            photos[key] = photo
+        else:
+            photo.paste(im)
+
+    shown_panes: Dict[str, Tuple] = {}  # pane key -> content of the image currently displayed
+    fast_panes = set()  # panes currently displayed with the nearest-neighbour drag resize
+    axial_cache = None  # ((axial_idx, ww, wl), windowed slice) reused while only the plane changes
+    # (ww, wl) of recently applied presets -> plane -> uint8 stack, windowed lazily per plane.
+    preset_cache: 'OrderedDict[Tuple[int, int], Dict[str, np.ndarray]]' = OrderedDict()
+    slider_plane = None  # plane the reformat slider range and titles were last configured for
+
+    def windowed_slice(plane: str, index: int, ww: int, wl: int) -> np.ndarray:
+        stacks = preset_cache.get((ww, wl))
+        if stacks is not None:
+            if plane not in stacks:
+                stacks[plane] = window_level_array((device_volumes or plane_volumes)[plane], ww, wl)
+            return stacks[plane][index]
+        return render_plane(plane_volumes[plane], index, ww, wl)
+
+    def refresh_images(val_dict: Dict, *, update_status: bool = True, fast: bool = False) -> None:
+        nonlocal axial_cache, slider_plane
         plane, axial_idx, reform_idx, ww, wl, reform_limit = parse_values(val_dict)
-        reform_idx = update_reformat_slider(plane, reform_idx)
+        if plane != slider_plane:
+            reform_idx = update_reformat_slider(plane, reform_idx)
+            slider_plane = plane
         val_dict['-REFORM_SLICE-'] = reform_idx
 
-        axial_slice = extract_plane(volume, 'Axial', axial_idx)
-        reform_slice = extract_plane(volume, plane, reform_idx)
-
-        axial_img = window_level_image(axial_slice, ww, wl)
-        reform_img = window_level_image(reform_slice, ww, wl)
-
-        overlay = update_overlay_coords(plane, reform_idx, reform_limit, axial_img.shape)
-        window['-AXIAL-'].update(data=to_pil(axial_img, size=image_size, overlay_line=overlay))
-        window['-REFORM-'].update(data=to_pil(reform_img, size=image_size))
+        # A pane is redrawn when its own content changed, or on a full-quality pass when it
+        # still shows a fast drag render; unchanged panes never drop to the fast resize.
+        overlay = update_overlay_coords(plane, reform_idx, reform_limit, (y_dim, x_dim))
+        axial_state = (axial_idx, ww, wl, overlay)
+        reform_state = (plane, reform_idx, ww, wl)
+        redraw_axial = shown_panes.get('-AXIAL-') != axial_state or (not fast and '-AXIAL-' in fast_panes)
+        redraw_reform = shown_panes.get('-REFORM-') != reform_state or (not fast and '-REFORM-' in fast_panes)
+        if not (redraw_axial or redraw_reform):
+            return
+
+        if redraw_axial:
+            axial_key = (axial_idx, ww, wl)
+            if axial_cache is None or axial_cache[0] != axial_key:
+                axial_cache = (axial_key, windowed_slice('Axial', axial_idx, ww, wl))
+            show_image('-AXIAL-', to_pil(axial_cache[1], size=image_size, overlay_line=overlay, fast=fast))
+            shown_panes['-AXIAL-'] = axial_state
+            if fast:
+                fast_panes.add('-AXIAL-')
+            else:
+                fast_panes.discard('-AXIAL-')
+        if redraw_reform:
+            reform_img = windowed_slice(plane, reform_idx, ww, wl)
+            show_image('-REFORM-', to_pil(reform_img, size=image_size, fast=fast))
+            shown_panes['-REFORM-'] = reform_state
+            if fast:
+                fast_panes.add('-REFORM-')
+            else:
+                fast_panes.discard('-REFORM-')
         update_readouts(plane, axial_idx, reform_idx, reform_limit, ww, wl, update_status=update_status)
 
     def apply_preset(key: str, val_dict: Dict) -> Tuple[Dict, str]:
         label, ww_val, wl_val = preset_map[key]
         ww_val = clamp(ww_val, 1, ww_slider_max)
         wl_val = clamp(wl_val, wl_min, wl_max)
+        # Scrolling under a preset becomes a plain slice lookup; each plane is windowed
+        # the first time it is shown (numba, LUT gather or GPU via window_level_array).
+        preset_cache.setdefault((ww_val, wl_val), {})
+        preset_cache.move_to_end((ww_val, wl_val))
+        while len(preset_cache) > PRESET_CACHE_SIZE:
+            preset_cache.popitem(last=False)
         window['-WW-'].update(value=ww_val)
         window['-WL-'].update(value=wl_val)
         val_dict['-WW-'] = ww_val
@@ -321,9 +573,9 @@ def main():
         val_dict['-PLANE-'] = default_plane
         val_dict['-REFORM_SLICE-'] = reformat_default
         window['-PLANE-'].update(value=default_plane)
-        window['-REFORM_SLICE-'].update(range=(0, plane_limit(volume, default_plane)), value=reformat_default)
-        window['-PLANE_DESC-'].update(plane_label(default_plane))
-        window['-REFORM_TITLE-'].update(f'再構成断面 - {plane_label(default_plane)}')
+        window['-REFORM_SLICE-'].update(range=(0, plane_limits[default_plane]), value=reformat_default)
+        window['-PLANE_DESC-'].update(plane_labels[default_plane])
+        window['-REFORM_TITLE-'].update(f'再構成断面 - {plane_labels[default_plane]}')
         return val_dict
 
     init_event, init_values = window.read(timeout=0)
@@ -334,10 +586,32 @@ def main():
         init_values['-PLANE-'] = default_plane
     refresh_images(init_values)
 
+    dirty = False  # slider moved since the last render
+    pending_smooth = False  # last render used the fast resize
+    last_render_time = 0.0
     while True:
-        event, values = window.read()
+        if dirty:
+            timeout = RENDER_INTERVAL_MS
+        elif pending_smooth:
+            timeout = SETTLE_DELAY_MS
+        else:
+            timeout = None
+        event, values = window.read(timeout=timeout)
         if event == sg.WIN_CLOSED or event == 'Quit' or values is None:
             break
+        if event == sg.TIMEOUT_EVENT or event in SLIDER_EVENTS:
+            if event in SLIDER_EVENTS:
+                dirty = True
+            elapsed_ms = (time.monotonic() - last_render_time) * 1000.0
+            if dirty and (event == sg.TIMEOUT_EVENT or elapsed_ms >= RENDER_INTERVAL_MS):
+                refresh_images(values, fast=True)
+                last_render_time = time.monotonic()
+                dirty = False
+                pending_smooth = True
+            elif pending_smooth and not dirty and event == sg.TIMEOUT_EVENT:
+                refresh_images(values)
+                pending_smooth = False
+            continue
         if event == '-FULLSCREEN-':
             try:
                 window.maximize()
@@ -345,6 +619,9 @@ def main():
                 window.Maximize()
             window['-STATUS-'].update('全画面表示に切り替えました')
             continue
+        if event in ('-RESET-PLANE-', '-RESET-WINDOW-', '-PLANE-') or event in preset_map:
+            # These render the latest values at full quality, superseding any pending pass.
+            dirty = pending_smooth = False
         if event == '-RESET-PLANE-':
             values = reset_plane_state(values)
             refresh_images(values)
@@ -365,7 +642,7 @@ def main():
             refresh_images(values, update_status=False)
             window['-STATUS-'].update(f'プリセット適用: {preset_label}')
             continue
-        if event in ('-PLANE-', '-AXIAL_SLICE-', '-REFORM_SLICE-', '-WW-', '-WL-'):
+        if event == '-PLANE-':
             refresh_images(values)
 
     window.close()